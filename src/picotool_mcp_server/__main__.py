@@ -1,7 +1,23 @@
 """Main entry point for picotool MCP server."""
 
 import asyncio
-from .server import main
+import sys
+
+from . import server
+
+
+def main() -> None:
+    """Run the MCP server, using uvloop as the event loop when available."""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
+    asyncio.run(server.main())
+
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -1,8 +1,66 @@
 """Picotool command wrapper."""
 
 import asyncio
+import functools
+import itertools
+import json
+import logging
+import math
+import os
 import shutil
-from typing import List, Optional
+import subprocess
+import sys
+import tempfile
+import time
+from typing import IO, Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger("picotool-mcp-server")
+
+# Boolean `picotool info` options and their flags
+_INFO_BOOL_FLAGS = (
+    ("basic", "-b"),
+    ("metadata", "-m"),
+    ("pins", "-p"),
+    ("device", "-d"),
+    ("debug", "--debug"),
+    ("build", "-l"),
+)
+
+# Device selection options and their flags
+_DEVICE_SEL = (
+    ("bus", "--bus"),
+    ("address", "--address"),
+    ("vid", "--vid"),
+    ("pid", "--pid"),
+    ("serial", "--ser"),
+)
+
+
+# Chunk size used when draining picotool output pipes
+_READ_CHUNK_SIZE = 65536
+
+# StreamReader buffer limit for picotool output. The default 64 KiB makes
+# the pipe transport pause/resume reading repeatedly on large `info -a`
+# metadata dumps. Output is drained in chunks, so larger output still works.
+_STREAM_LIMIT = 1 << 20
+
+
+# Helper script that runs picotool on behalf of the server
+_RUNNER_SCRIPT = os.path.join(os.path.dirname(__file__), "runner.py")
+
+# Default number of picotool runner processes kept by each wrapper
+_DEFAULT_POOL_SIZE = 2
+
+# Seconds a runner gets to stop its picotool command and exit before it's
+# killed; longer than the runner's own grace period for picotool
+_RUNNER_STOP_TIMEOUT = 2.0
+
+# Default lifetime in seconds of cached info/partition_info results;
+# override with the PICOTOOL_CACHE_TTL environment variable (0 disables)
+_DEFAULT_CACHE_TTL = 2.0
+
+# ASCII whitespace stripped from picotool output
+_WHITESPACE = frozenset(b" \t\n\r\x0b\x0c")
 
 
 class PicotoolError(Exception):
@@ -10,25 +68,552 @@ class PicotoolError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=1)
+def _find_picotool() -> str:
+    """Locate the picotool binary on PATH.
+
+    The PATH walk happens once per process; later wrappers reuse the result.
+
+    Returns:
+        Absolute path to the picotool binary
+
+    Raises:
+        PicotoolError: If picotool is not found in PATH
+    """
+    picotool_path = shutil.which("picotool")
+    if picotool_path is None:
+        raise PicotoolError("picotool not found in PATH. Please install picotool.")
+    return os.path.abspath(picotool_path)
+
+
+def _can_attach_pipes(loop: asyncio.AbstractEventLoop) -> bool:
+    """Whether the loop can read and write plain subprocess.Popen pipes.
+    
+    Unix selector loops and uvloop accept any pipe file object. Windows'
+    ProactorEventLoop only drives overlapped pipe handles, so it can't use
+    the executor spawn or the runner pool.
+    """
+    if sys.platform == "win32":
+        return False
+    return (
+        isinstance(loop, asyncio.SelectorEventLoop)
+        or type(loop).__module__.startswith("uvloop")
+    )
+
+
+async def _read_pipe(pipe: IO[bytes]) -> bytearray:
+    """Drain a subprocess pipe to EOF without blocking the event loop.
+    
+    Output is read in large chunks into a single buffer, so big `info -a`
+    dumps don't go through repeated intermediate bytes objects.
+    
+    Args:
+        pipe: Pipe file object from a subprocess.Popen instance
+        
+    Returns:
+        Everything written to the pipe
+    """
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=_STREAM_LIMIT)
+    transport, _ = await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(reader), pipe
+    )
+    
+    try:
+        buf = bytearray()
+        while chunk := await reader.read(_READ_CHUNK_SIZE):
+            buf.extend(chunk)
+        return buf
+    finally:
+        # Not every event loop (e.g. uvloop) closes the transport at EOF
+        transport.close()
+
+
+def _decode_output(buf: bytes | bytearray) -> str:
+    """Decode picotool output with surrounding whitespace removed.
+    
+    Whitespace is trimmed by index and only that slice is decoded, so the
+    output is copied once instead of once for decode() and again for strip().
+    
+    Args:
+        buf: Raw output from picotool
+        
+    Returns:
+        Decoded output; invalid UTF-8 is replaced rather than raising
+    """
+    start, end = 0, len(buf)
+    while start < end and buf[start] in _WHITESPACE:
+        start += 1
+    while end > start and buf[end - 1] in _WHITESPACE:
+        end -= 1
+    return str(memoryview(buf)[start:end], "utf-8", "replace")
+
+
+def _spawn_sync(cmd: List[bytes], stderr: IO[bytes]) -> "subprocess.Popen[bytes]":
+    """Start picotool with piped stdout.
+    
+    This blocks until the child has exec'd: Popen waits on an internal
+    error pipe for the whole fork/exec, which can take seconds under IO
+    pressure (cpython issue #81444). Call it from an executor thread rather
+    than the event loop; the returned pipes are then read asynchronously.
+    
+    Args:
+        cmd: Full command line, pre-encoded as bytes
+        stderr: File to receive picotool's stderr
+        
+    Returns:
+        The running process
+    """
+    return subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=stderr,
+        # Keeps Popen eligible for its posix_spawn() fast path, which also
+        # needs an executable path with a directory component and no
+        # preexec_fn/cwd/session/uid changes. Our own fds are non-inheritable
+        # by default (PEP 446), so nothing leaks into picotool.
+        close_fds=False
+    )
+
+
+def _spawn_runner_sync(picotool_path: str) -> "subprocess.Popen[bytes]":
+    """Start a picotool runner process with piped stdin/stdout.
+    
+    Blocks for the fork/exec just like _spawn_sync, so call it from an
+    executor thread too.
+    
+    Args:
+        picotool_path: Path to the picotool binary the runner should use
+        
+    Returns:
+        The running runner process
+    """
+    return subprocess.Popen(
+        [sys.executable, _RUNNER_SCRIPT, picotool_path],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        close_fds=False
+    )
+
+
+async def _kill(process: "subprocess.Popen[bytes]") -> None:
+    """Kill a spawned process, close its pipes and reap it off the event loop."""
+    process.kill()
+    for pipe in (process.stdin, process.stdout):
+        if pipe is not None:
+            pipe.close()
+    await asyncio.get_running_loop().run_in_executor(None, process.wait)
+
+
+def _kill_when_spawned(spawn: "asyncio.Future[subprocess.Popen[bytes]]") -> None:
+    """Kill a process whose spawn finished after its caller was cancelled."""
+    if not spawn.cancelled() and spawn.exception() is None:
+        asyncio.ensure_future(_kill(spawn.result()))
+
+
+def _device_args(
+    force: bool,
+    force_no_reboot: bool,
+    **selectors: Optional[str]
+) -> List[str]:
+    """Build device selection and force arguments.
+    
+    Args:
+        force: Force device not in BOOTSEL mode to reset
+        force_no_reboot: Force device reset but don't reboot back
+        **selectors: Device selection values keyed by option name
+        
+    Returns:
+        Arguments to append to a picotool command
+    """
+    args = list(itertools.chain.from_iterable(
+        (flag, value) for name, flag in _DEVICE_SEL if (value := selectors.get(name))
+    ))
+    
+    # Force options must be last
+    if force:
+        args.append("-f")
+    elif force_no_reboot:
+        args.append("-F")
+    
+    return args
+
+
+# Return code, stdout and stderr of a picotool command
+_CommandResult = Tuple[int, "bytes | bytearray", bytes]
+
+_Method = Callable[..., Awaitable[str]]
+
+
+def _cache_ttl_from_env() -> float:
+    """Read the result cache TTL from PICOTOOL_CACHE_TTL.
+    
+    Returns:
+        The configured TTL, or the default if unset or not a finite number
+    """
+    value = os.environ.get("PICOTOOL_CACHE_TTL")
+    if value is None:
+        return _DEFAULT_CACHE_TTL
+    
+    try:
+        ttl = float(value)
+    except ValueError:
+        ttl = math.nan
+    
+    if not math.isfinite(ttl):
+        logger.warning(
+            "Ignoring invalid PICOTOOL_CACHE_TTL=%r; using %s seconds",
+            value,
+            _DEFAULT_CACHE_TTL
+        )
+        return _DEFAULT_CACHE_TTL
+    return ttl
+
+
+def _cached(method: _Method) -> _Method:
+    """Cache a read-only PicotoolWrapper method's output for the cache TTL.
+    
+    Agents often repeat the same query within seconds; identical calls
+    inside the TTL are answered without running picotool again.
+    
+    Calls that force a device into BOOTSEL mode change its state, so they
+    always run and invalidate the cache like reboot/erase. Calls on a file
+    target always run too, since the file may change on disk.
+    """
+    invalidating = _invalidates_cache(method)
+    
+    @functools.wraps(method)
+    async def wrapper(self: "PicotoolWrapper", *args: Any, **kwargs: Any) -> str:
+        if kwargs.get("force") or kwargs.get("force_no_reboot"):
+            return await invalidating(self, *args, **kwargs)
+        if self._cache_ttl <= 0 or kwargs.get("target"):
+            return await method(self, *args, **kwargs)
+        
+        key = (method.__name__, args, frozenset(kwargs.items()))
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and now - entry[0] < self._cache_ttl:
+            return entry[1]
+        
+        generation = self._cache_generation
+        result = await method(self, *args, **kwargs)
+        # Don't store output that a reboot/erase may have made stale meanwhile
+        if generation == self._cache_generation:
+            # Drop expired entries so distinct queries don't accumulate
+            expiry = time.monotonic() - self._cache_ttl
+            for stale in [k for k, (ts, _) in self._cache.items() if ts <= expiry]:
+                del self._cache[stale]
+            self._cache[key] = (now, result)
+        return result
+    
+    return wrapper
+
+
+def _invalidates_cache(method: _Method) -> _Method:
+    """Clear cached results after a state-changing PicotoolWrapper method."""
+    @functools.wraps(method)
+    async def wrapper(self: "PicotoolWrapper", *args: Any, **kwargs: Any) -> str:
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            self._cache.clear()
+            self._cache_generation += 1
+    
+    return wrapper
+
+
+class _Runner:
+    """Client side of a picotool runner process (see runner.py)."""
+    
+    def __init__(
+        self,
+        process: "subprocess.Popen[bytes]",
+        stdin: asyncio.WriteTransport,
+        stdout_transport: asyncio.ReadTransport,
+        stdout: asyncio.StreamReader
+    ) -> None:
+        self._process = process
+        self._stdin = stdin
+        self._stdout_transport = stdout_transport
+        self._stdout = stdout
+    
+    @classmethod
+    async def start(cls, picotool_path: str) -> "_Runner":
+        """Start a runner process for the given picotool binary.
+        
+        Like picotool itself, the runner is spawned on a worker thread
+        (see _spawn_runner_sync) and its pipes are attached to the loop.
+        """
+        loop = asyncio.get_running_loop()
+        spawn = loop.run_in_executor(None, _spawn_runner_sync, picotool_path)
+        try:
+            process = await asyncio.shield(spawn)
+        except asyncio.CancelledError:
+            spawn.add_done_callback(_kill_when_spawned)
+            raise
+        
+        assert process.stdin is not None
+        assert process.stdout is not None
+        
+        try:
+            reader = asyncio.StreamReader(limit=_STREAM_LIMIT)
+            stdout_transport, _ = await loop.connect_read_pipe(
+                lambda: asyncio.StreamReaderProtocol(reader), process.stdout
+            )
+            stdin_transport, _ = await loop.connect_write_pipe(
+                asyncio.Protocol, process.stdin
+            )
+        except BaseException:
+            await asyncio.shield(_kill(process))
+            raise
+        
+        return cls(process, stdin_transport, stdout_transport, reader)
+    
+    @property
+    def alive(self) -> bool:
+        """Whether the runner process is still running."""
+        return self._process.poll() is None
+    
+    async def run(self, args: List[str]) -> Union[_CommandResult, OSError]:
+        """Run one picotool command through the runner.
+        
+        Args:
+            args: Command arguments (excluding 'picotool')
+            
+        Returns:
+            Tuple of picotool's return code, stdout and stderr (only sent if
+            the command failed), or the error that kept the runner from
+            starting picotool (FileNotFoundError if the binary is missing).
+            The runner stays usable after such an error.
+            
+        Raises:
+            OSError: If the runner exits
+        """
+        # A request is one short line, well under the pipe buffer, so it is
+        # written without waiting for the transport to drain
+        self._stdin.write(json.dumps(args).encode() + b"\n")
+        
+        line = await self._stdout.readline()
+        if not line:
+            raise OSError("picotool runner exited unexpectedly")
+        
+        header = json.loads(line)
+        if "error" in header:
+            if header["not_found"]:
+                return FileNotFoundError(header["error"])
+            return OSError(header["error"])
+        
+        stdout = await self._stdout.readexactly(header["stdout"])
+        stderr = await self._stdout.readexactly(header["stderr"])
+        return header["returncode"], stdout, stderr
+    
+    async def close(self) -> None:
+        """Stop the runner process.
+        
+        The runner is asked to stop with SIGTERM first, so it can stop the
+        picotool command it is running; it is killed if it doesn't exit in
+        time.
+        """
+        self._process.terminate()
+        self._stdin.close()
+        self._stdout_transport.close()
+        
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(
+                None, self._process.wait, _RUNNER_STOP_TIMEOUT
+            )
+        except subprocess.TimeoutExpired:
+            await _kill(self._process)
+
+
+class _RunnerPool:
+    """Small pool of picotool runner processes.
+    
+    Runners are started lazily, up to `size` of them, and reused across
+    commands. A runner that fails mid-command is discarded and its slot is
+    refilled by a fresh runner on next use.
+    """
+    
+    def __init__(self, picotool_path: str, size: int) -> None:
+        self._picotool_path = picotool_path
+        # Idle runners, or None for a slot whose runner hasn't started yet
+        self._slots: asyncio.Queue[Optional[_Runner]] = asyncio.Queue()
+        for _ in range(size):
+            self._slots.put_nowait(None)
+        self._runners: List[_Runner] = []
+    
+    async def run(self, args: List[str]) -> _CommandResult:
+        """Run one picotool command on an idle runner.
+        
+        Args:
+            args: Command arguments (excluding 'picotool')
+            
+        Returns:
+            Tuple of picotool's return code, stdout and stderr (only sent if
+            the command failed)
+            
+        Raises:
+            FileNotFoundError: If the picotool binary is missing
+            OSError: If picotool or a runner can't be started
+        """
+        runner = await self._slots.get()
+        try:
+            if runner is not None and not runner.alive:
+                dead, runner = runner, None
+                self._runners.remove(dead)
+                await dead.close()
+            if runner is None:
+                runner = await _Runner.start(self._picotool_path)
+                self._runners.append(runner)
+            result = await runner.run(args)
+        except BaseException:
+            # The runner's protocol state is unknown; free the slot and drop it
+            self._slots.put_nowait(None)
+            if runner is not None:
+                self._runners.remove(runner)
+                await asyncio.shield(runner.close())
+            raise
+        
+        # Failing to start picotool leaves the runner itself healthy
+        self._slots.put_nowait(runner)
+        if isinstance(result, OSError):
+            raise result
+        return result
+    
+    async def close(self) -> None:
+        """Stop all runner processes."""
+        for runner in self._runners:
+            await runner.close()
+
+
 class PicotoolWrapper:
     """Wrapper for picotool command-line interface."""
     
-    def __init__(self, picotool_path: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        picotool_path: Optional[str] = None,
+        pool_size: int = _DEFAULT_POOL_SIZE,
+        cache_ttl: Optional[float] = None
+    ) -> None:
         """Initialize picotool wrapper.
         
         Args:
             picotool_path: Path to picotool binary. If None, will search PATH.
+            pool_size: Number of runner processes used to launch picotool.
+                If 0, picotool is spawned directly for every command.
+            cache_ttl: Seconds to reuse info/partition_info results for.
+                If None, uses PICOTOOL_CACHE_TTL or 2 seconds; 0 disables.
         """
         if picotool_path is None:
-            picotool_path = shutil.which("picotool")
-            if picotool_path is None:
-                raise PicotoolError("picotool not found in PATH. Please install picotool.")
+            picotool_path = _find_picotool()
         
         self.picotool_path = picotool_path
+        self._pool = _RunnerPool(picotool_path, pool_size) if pool_size > 0 else None
+        self._version_cache: Optional[str] = None
+        self._version_lock = asyncio.Lock()
+        
+        if cache_ttl is None:
+            cache_ttl = _cache_ttl_from_env()
+        self._cache_ttl = cache_ttl
+        self._cache: Dict[tuple, Tuple[float, str]] = {}
+        self._cache_generation = 0
+    
+    async def close(self) -> None:
+        """Stop any runner processes started by this wrapper."""
+        if self._pool is not None:
+            await self._pool.close()
+    
+    async def _spawn_command(self, args: List[str]) -> _CommandResult:
+        """Spawn picotool directly from this process.
+        
+        Args:
+            args: Command arguments (excluding 'picotool')
+            
+        Returns:
+            Tuple of picotool's return code, stdout and stderr (only read if
+            the command failed)
+        """
+        # Pre-encode argv; Popen would otherwise fsencode each item itself
+        cmd = [os.fsencode(self.picotool_path)] + [os.fsencode(a) for a in args]
+        loop = asyncio.get_running_loop()
+        
+        # stderr is only needed when the command fails, so send it to a
+        # temporary file instead of standing up a second pipe and reader
+        with tempfile.TemporaryFile() as stderr:
+            # Spawn on a worker thread (see _spawn_sync). The spawn itself
+            # can't be interrupted, so if we're cancelled meanwhile, kill the
+            # child once it exists rather than leaking it.
+            spawn = loop.run_in_executor(None, _spawn_sync, cmd, stderr)
+            try:
+                process = await asyncio.shield(spawn)
+            except asyncio.CancelledError:
+                spawn.add_done_callback(_kill_when_spawned)
+                raise
+            
+            assert process.stdout is not None
+            
+            try:
+                stdout = await _read_pipe(process.stdout)
+                returncode = await loop.run_in_executor(None, process.wait)
+            except BaseException:
+                await asyncio.shield(_kill(process))
+                raise
+            
+            if returncode == 0:
+                return returncode, stdout, b""
+            
+            stderr.seek(0)
+            return returncode, stdout, stderr.read()
+    
+    async def _exec_command(self, args: List[str]) -> _CommandResult:
+        """Run picotool through asyncio's own subprocess support.
+        
+        Used on event loops that can't attach plain Popen pipes (see
+        _can_attach_pipes). The spawn runs on the event loop thread here.
+        
+        Args:
+            args: Command arguments (excluding 'picotool')
+            
+        Returns:
+            Tuple of picotool's return code, stdout and stderr (only read if
+            the command failed)
+        """
+        with tempfile.TemporaryFile() as stderr:
+            process = await asyncio.create_subprocess_exec(
+                self.picotool_path,
+                *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=stderr,
+                limit=_STREAM_LIMIT
+            )
+            assert process.stdout is not None
+            
+            try:
+                stdout = bytearray()
+                while chunk := await process.stdout.read(_READ_CHUNK_SIZE):
+                    stdout.extend(chunk)
+                returncode = await process.wait()
+            except BaseException:
+                if process.returncode is None:
+                    process.kill()
+                await asyncio.shield(process.wait())
+                raise
+            
+            if returncode == 0:
+                return returncode, stdout, b""
+            
+            stderr.seek(0)
+            return returncode, stdout, stderr.read()
     
     async def _run_command(self, args: List[str]) -> str:
         """Run a picotool command and return stdout.
         
+        picotool has no persistent/REPL mode, so every command is a fresh
+        picotool process. By default it is launched by a pooled runner
+        process rather than forked from the server itself. Event loops that
+        can't attach plain pipes (Windows) use asyncio's subprocess support.
+        
         Args:
             args: Command arguments (excluding 'picotool')
             
@@ -38,28 +623,26 @@ class PicotoolWrapper:
         Raises:
             PicotoolError: If command fails
         """
-        cmd = [self.picotool_path] + args
-        
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            stdout, stderr = await process.communicate()
+            if not _can_attach_pipes(asyncio.get_running_loop()):
+                returncode, stdout, stderr = await self._exec_command(args)
+            elif self._pool is not None:
+                returncode, stdout, stderr = await self._pool.run(args)
+            else:
+                returncode, stdout, stderr = await self._spawn_command(args)
             
-            if process.returncode != 0:
-                error_msg = stderr.decode("utf-8").strip()
+            if returncode != 0:
+                error_msg = _decode_output(stderr)
                 raise PicotoolError(f"picotool command failed: {error_msg}")
             
-            return stdout.decode("utf-8").strip()
+            return _decode_output(stdout)
         
         except FileNotFoundError:
             raise PicotoolError(f"picotool binary not found at: {self.picotool_path}")
         except Exception as e:
             raise PicotoolError(f"Error running picotool: {str(e)}")
     
+    @_cached
     async def info(
         self,
         target: str = "",
@@ -106,43 +689,34 @@ class PicotoolWrapper:
         if all:
             args.append("-a")
         else:
-            if basic:
-                args.append("-b")
-            if metadata:
-                args.append("-m")
-            if pins:
-                args.append("-p")
-            if device:
-                args.append("-d")
-            if debug:
-                args.append("--debug")
-            if build:
-                args.append("-l")
+            options = {
+                "basic": basic,
+                "metadata": metadata,
+                "pins": pins,
+                "device": device,
+                "debug": debug,
+                "build": build,
+            }
+            args.extend(flag for name, flag in _INFO_BOOL_FLAGS if options[name])
         
         # Add target if specified (must come before device selection options)
         if target:
             args.append(target)
         
-        # Add device selection options
-        if bus:
-            args.extend(["--bus", bus])
-        if address:
-            args.extend(["--address", address])
-        if vid:
-            args.extend(["--vid", vid])
-        if pid:
-            args.extend(["--pid", pid])
-        if serial:
-            args.extend(["--ser", serial])
-        
-        # Add force options (must be last)
-        if force:
-            args.append("-f")
-        elif force_no_reboot:
-            args.append("-F")
+        # Add device selection and force options (must be last)
+        args.extend(_device_args(
+            force,
+            force_no_reboot,
+            bus=bus,
+            address=address,
+            vid=vid,
+            pid=pid,
+            serial=serial
+        ))
         
         return await self._run_command(args)
     
+    @_invalidates_cache
     async def reboot(
         self,
         all_devices: bool = False,
@@ -187,34 +761,37 @@ class PicotoolWrapper:
         if cpu:
             args.extend(["-c", cpu])
         
-        # Add device selection options
-        if bus:
-            args.extend(["--bus", bus])
-        if address:
-            args.extend(["--address", address])
-        if vid:
-            args.extend(["--vid", vid])
-        if pid:
-            args.extend(["--pid", pid])
-        if serial:
-            args.extend(["--ser", serial])
-        
-        # Add force options (must be last)
-        if force:
-            args.append("-f")
-        elif force_no_reboot:
-            args.append("-F")
+        # Add device selection and force options (must be last)
+        args.extend(_device_args(
+            force,
+            force_no_reboot,
+            bus=bus,
+            address=address,
+            vid=vid,
+            pid=pid,
+            serial=serial
+        ))
         
         return await self._run_command(args)
     
     async def version(self) -> str:
         """Get picotool version.
         
+        The binary doesn't change while the server runs, so the result of the
+        first successful call is reused.
+        
         Returns:
             Version string from picotool
         """
-        return await self._run_command(["version"])
+        if self._version_cache is not None:
+            return self._version_cache
+        
+        async with self._version_lock:
+            if self._version_cache is None:
+                self._version_cache = await self._run_command(["version"])
+            return self._version_cache
     
+    @_cached
     async def partition_info(
         self,
         family_id: Optional[str] = None,
@@ -247,26 +824,20 @@ class PicotoolWrapper:
         if family_id:
             args.extend(["-m", family_id])
         
-        # Add device selection options
-        if bus:
-            args.extend(["--bus", bus])
-        if address:
-            args.extend(["--address", address])
-        if vid:
-            args.extend(["--vid", vid])
-        if pid:
-            args.extend(["--pid", pid])
-        if serial:
-            args.extend(["--ser", serial])
-        
-        # Add force options (must be last)
-        if force:
-            args.append("-f")
-        elif force_no_reboot:
-            args.append("-F")
+        # Add device selection and force options (must be last)
+        args.extend(_device_args(
+            force,
+            force_no_reboot,
+            bus=bus,
+            address=address,
+            vid=vid,
+            pid=pid,
+            serial=serial
+        ))
         
         return await self._run_command(args)
     
+    @_invalidates_cache
     async def erase(
         self,
         all_flash: bool = False,
@@ -311,22 +882,15 @@ class PicotoolWrapper:
         elif range_start or range_end:
             raise PicotoolError("Both range_start and range_end must be specified for range erase")
         
-        # Add device selection options
-        if bus:
-            args.extend(["--bus", bus])
-        if address:
-            args.extend(["--address", address])
-        if vid:
-            args.extend(["--vid", vid])
-        if pid:
-            args.extend(["--pid", pid])
-        if serial:
-            args.extend(["--ser", serial])
-        
-        # Add force options (must be last)
-        if force:
-            args.append("-f")
-        elif force_no_reboot:
-            args.append("-F")
+        # Add device selection and force options (must be last)
+        args.extend(_device_args(
+            force,
+            force_no_reboot,
+            bus=bus,
+            address=address,
+            vid=vid,
+            pid=pid,
+            serial=serial
+        ))
         
         return await self._run_command(args)
\ No newline at end of file
@@ -0,0 +1,106 @@
+"""Picotool runner process.
+
+A small, long-lived helper that runs picotool commands on behalf of the
+server, so the server itself never has to spawn a process per tool call.
+
+Protocol (one command at a time):
+    request:  a JSON list of picotool arguments, terminated by a newline
+    response: a JSON header line with "returncode", "stdout" and "stderr"
+              (byte lengths), followed by the raw stdout and stderr bytes.
+              stderr is only sent for failed commands.
+              If picotool could not be started the header carries an
+              "error" message instead, plus "not_found" when the binary
+              is missing.
+
+Only the standard library is imported, to keep runner startup cheap.
+"""
+
+import json
+import signal
+import subprocess
+import sys
+import tempfile
+
+# How long picotool gets to exit after being asked to stop before it's killed
+_STOP_TIMEOUT = 1.0
+
+
+def _stop(signum: int, frame: object) -> None:
+    """Turn SIGTERM into SystemExit so a running picotool is stopped too."""
+    sys.exit(128 + signum)
+
+
+def _run(picotool_path: str, args: list) -> tuple:
+    """Run one picotool command and capture its output.
+
+    As in the server's direct spawn path, stderr goes to a temporary file
+    that is only read if the command failed, and stdout is the only pipe,
+    so it is read in one go rather than collected in chunks and joined.
+
+    If the runner is told to stop meanwhile, the stop is forwarded to
+    picotool and the runner waits for it to exit, so no picotool process
+    outlives its runner.
+    """
+    with tempfile.TemporaryFile() as stderr:
+        # stdin=DEVNULL keeps picotool from reading our request pipe;
+        # close_fds=False keeps the posix_spawn() fast path available
+        process = subprocess.Popen(
+            [picotool_path] + args,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+            close_fds=False
+        )
+
+        with process:
+            try:
+                stdout, _ = process.communicate()
+            except BaseException:
+                process.terminate()
+                try:
+                    process.wait(_STOP_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                raise
+
+        if process.returncode == 0:
+            return process.returncode, stdout, b""
+
+        stderr.seek(0)
+        return process.returncode, stdout, stderr.read()
+
+
+def main() -> None:
+    """Serve picotool commands read from stdin until it is closed."""
+    picotool_path = sys.argv[1]
+    requests = sys.stdin.buffer
+    responses = sys.stdout.buffer
+
+    signal.signal(signal.SIGTERM, _stop)
+
+    for line in requests:
+        args = json.loads(line)
+
+        try:
+            returncode, stdout, stderr = _run(picotool_path, args)
+        except OSError as e:
+            header = {
+                "error": str(e),
+                "not_found": isinstance(e, FileNotFoundError)
+            }
+            responses.write(json.dumps(header).encode() + b"\n")
+        else:
+            header = {
+                "returncode": returncode,
+                "stdout": len(stdout),
+                "stderr": len(stderr)
+            }
+            responses.write(json.dumps(header).encode() + b"\n")
+            responses.write(stdout)
+            responses.write(stderr)
+
+        responses.flush()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
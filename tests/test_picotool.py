@@ -0,0 +1,324 @@
+"""Tests for the picotool wrapper, run against a fake picotool script."""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+from picotool_mcp_server import picotool
+from picotool_mcp_server.picotool import PicotoolError, PicotoolWrapper
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="fake picotool is a shell script"
+)
+
+FAKE_PICOTOOL = """#!/bin/sh
+case "$1" in
+    fail) echo "partial"; echo "no device found" >&2; exit 3;;
+    big) head -c 200000 /dev/zero;;
+    slow) echo $$ > "$(dirname "$0")/slow.pid"; exec sleep 5;;
+    *) echo "args: $*"; echo "warning" >&2;;
+esac
+"""
+
+
+@pytest.fixture
+def fake_picotool(tmp_path):
+    """Path to an executable fake picotool."""
+    path = tmp_path / "picotool"
+    path.write_text(FAKE_PICOTOOL)
+    path.chmod(0o755)
+    return str(path)
+
+
+def run(coro):
+    """Run a coroutine to completion on a fresh event loop."""
+    return asyncio.run(coro)
+
+
+def test_runner_frames_stdout_stderr_and_returncode(fake_picotool):
+    async def scenario():
+        wrapper = PicotoolWrapper(fake_picotool, pool_size=1, cache_ttl=0)
+        try:
+            # Several commands on the same runner, so a framing error would
+            # corrupt the responses that follow it
+            ok = await wrapper._pool.run(["info", "-b"])
+            big = await wrapper._pool.run(["big"])
+            failed = await wrapper._pool.run(["fail"])
+            again = await wrapper._pool.run(["version"])
+        finally:
+            await wrapper.close()
+        return ok, big, failed, again
+    
+    ok, big, failed, again = run(scenario())
+    
+    # stderr is only sent back for failed commands
+    assert ok == (0, b"args: info -b\n", b"")
+    assert big == (0, b"\0" * 200000, b"")
+    assert failed == (3, b"partial\n", b"no device found\n")
+    assert again == (0, b"args: version\n", b"")
+
+
+@pytest.mark.parametrize("pool_size", [0, 1])
+def test_command_output_and_failure(fake_picotool, pool_size):
+    async def scenario():
+        wrapper = PicotoolWrapper(fake_picotool, pool_size=pool_size, cache_ttl=0)
+        try:
+            output = await wrapper.info(serial="E660", force=True)
+            with pytest.raises(PicotoolError, match="no device found"):
+                await wrapper._run_command(["fail"])
+        finally:
+            await wrapper.close()
+        return output
+    
+    assert run(scenario()) == "args: info -b --ser E660 -f"
+
+
+def test_loops_without_pipe_support_use_asyncio_subprocess(
+    fake_picotool, monkeypatch
+):
+    # Stands in for Windows' ProactorEventLoop, which can't attach Popen pipes
+    monkeypatch.setattr(picotool, "_can_attach_pipes", lambda loop: False)
+    
+    async def scenario():
+        wrapper = PicotoolWrapper(fake_picotool, pool_size=1, cache_ttl=0)
+        try:
+            output = await wrapper.info(serial="E660")
+            big = await wrapper._run_command(["big"])
+            with pytest.raises(PicotoolError, match="no device found"):
+                await wrapper._run_command(["fail"])
+            runners = len(wrapper._pool._runners)
+        finally:
+            await wrapper.close()
+        return output, big, runners
+    
+    assert run(scenario()) == ("args: info -b --ser E660", "\0" * 200000, 0)
+
+
+@pytest.mark.parametrize("pool_size", [0, 1])
+def test_missing_binary_raises_picotool_error(tmp_path, pool_size):
+    missing = str(tmp_path / "no-such-picotool")
+    
+    async def scenario():
+        wrapper = PicotoolWrapper(missing, pool_size=pool_size)
+        try:
+            with pytest.raises(PicotoolError, match="picotool binary not found"):
+                await wrapper.version()
+            runners = list(wrapper._pool._runners) if wrapper._pool else []
+            with pytest.raises(PicotoolError, match="picotool binary not found"):
+                await wrapper.version()
+            # The runner that reported the missing binary is kept, not respawned
+            if wrapper._pool is not None:
+                assert wrapper._pool._runners == runners
+                assert all(runner.alive for runner in runners)
+        finally:
+            await wrapper.close()
+    
+    run(scenario())
+
+
+def test_dead_runner_is_respawned(fake_picotool):
+    async def scenario():
+        wrapper = PicotoolWrapper(fake_picotool, pool_size=1, cache_ttl=0)
+        try:
+            await wrapper.info()
+            [first] = wrapper._pool._runners
+            first._process.kill()
+            first._process.wait()
+            
+            output = await wrapper.info()
+            [second] = wrapper._pool._runners
+        finally:
+            await wrapper.close()
+        return output, first, second
+    
+    output, first, second = run(scenario())
+    
+    assert output == "args: info -b"
+    assert second is not first
+    assert not first.alive
+
+
+def test_cancelled_command_frees_its_slot(fake_picotool, tmp_path):
+    async def scenario():
+        wrapper = PicotoolWrapper(fake_picotool, pool_size=1, cache_ttl=0)
+        try:
+            task = asyncio.ensure_future(wrapper._run_command(["slow"]))
+            await asyncio.sleep(0.5)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            
+            # With the only slot leaked this would wait forever
+            output = await asyncio.wait_for(wrapper.info(), timeout=5)
+            runners = len(wrapper._pool._runners)
+        finally:
+            await wrapper.close()
+        return output, runners
+    
+    assert run(scenario()) == ("args: info -b", 1)
+    
+    # The runner must not leave the cancelled picotool command running
+    pid = int((tmp_path / "slow.pid").read_text())
+    with pytest.raises(ProcessLookupError):
+        os.kill(pid, 0)
+
+
+def test_close_stops_running_command(fake_picotool, tmp_path):
+    async def scenario():
+        wrapper = PicotoolWrapper(fake_picotool, pool_size=1, cache_ttl=0)
+        task = asyncio.ensure_future(wrapper._run_command(["slow"]))
+        await asyncio.sleep(0.5)
+        await wrapper.close()
+        with pytest.raises(PicotoolError):
+            await task
+    
+    run(scenario())
+    
+    pid = int((tmp_path / "slow.pid").read_text())
+    with pytest.raises(ProcessLookupError):
+        os.kill(pid, 0)
+
+
+class FakeClock:
+    """Stand-in for the time module used by the result cache."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake clock driving the result cache TTL."""
+    fake = FakeClock()
+    monkeypatch.setattr(picotool, "time", fake)
+    return fake
+
+
+def counting_wrapper(cache_ttl):
+    """Wrapper whose commands are counted instead of run."""
+    wrapper = PicotoolWrapper("/unused/picotool", pool_size=0, cache_ttl=cache_ttl)
+    wrapper.calls = []
+    
+    async def fake_run_command(args):
+        wrapper.calls.append(args)
+        return f"output {len(wrapper.calls)}"
+    
+    wrapper._run_command = fake_run_command
+    return wrapper
+
+
+def test_cache_hit_and_expiry(clock):
+    wrapper = counting_wrapper(cache_ttl=2.0)
+    
+    async def scenario():
+        first = await wrapper.info(serial="A")
+        clock.now += 1.9
+        hit = await wrapper.info(serial="A")
+        other = await wrapper.info(serial="B")
+        clock.now += 0.2
+        expired = await wrapper.info(serial="A")
+        return first, hit, other, expired
+    
+    assert run(scenario()) == ("output 1", "output 1", "output 2", "output 3")
+
+
+def test_cache_prunes_expired_entries(clock):
+    wrapper = counting_wrapper(cache_ttl=2.0)
+    
+    async def scenario():
+        for serial in ("A", "B", "C"):
+            await wrapper.info(serial=serial)
+        clock.now += 5
+        await wrapper.partition_info()
+    
+    run(scenario())
+    
+    assert [key[0] for key in wrapper._cache] == ["partition_info"]
+
+
+def test_reboot_and_erase_invalidate_cache(clock):
+    wrapper = counting_wrapper(cache_ttl=2.0)
+    
+    async def scenario():
+        await wrapper.info()
+        await wrapper.reboot()
+        after_reboot = await wrapper.info()
+        with pytest.raises(PicotoolError):
+            await wrapper.erase(range_start="0x10000000")
+        after_failed_erase = await wrapper.info()
+        return after_reboot, after_failed_erase
+    
+    assert run(scenario()) == ("output 3", "output 4")
+
+
+@pytest.mark.parametrize("force", ["force", "force_no_reboot"])
+def test_forced_reads_run_uncached_and_invalidate_cache(clock, force):
+    wrapper = counting_wrapper(cache_ttl=2.0)
+    
+    async def scenario():
+        await wrapper.partition_info()
+        forced = [await wrapper.info(**{force: True}) for _ in range(2)]
+        after_forced = await wrapper.partition_info()
+        return forced, after_forced
+    
+    assert run(scenario()) == (["output 2", "output 3"], "output 4")
+
+
+def test_file_target_is_not_cached(clock):
+    wrapper = counting_wrapper(cache_ttl=2.0)
+    
+    async def scenario():
+        await wrapper.info()
+        first = await wrapper.info(target="app.uf2")
+        second = await wrapper.info(target="app.uf2")
+        device = await wrapper.info()
+        return first, second, device
+    
+    assert run(scenario()) == ("output 2", "output 3", "output 1")
+
+
+def test_read_racing_a_reboot_is_not_cached(clock):
+    wrapper = counting_wrapper(cache_ttl=2.0)
+    release = asyncio.Event()
+    fast_run_command = wrapper._run_command
+    
+    async def slow_run_command(args):
+        if args[0] == "info":
+            await release.wait()
+        return await fast_run_command(args)
+    
+    wrapper._run_command = slow_run_command
+    
+    async def scenario():
+        read = asyncio.ensure_future(wrapper.info())
+        await asyncio.sleep(0)
+        await wrapper.reboot()
+        release.set()
+        await read
+    
+    run(scenario())
+    
+    assert wrapper._cache == {}
+
+
+@pytest.mark.parametrize("value, expected", [
+    (None, 2.0),
+    ("5", 5.0),
+    ("0", 0.0),
+    ("soon", 2.0),
+    ("nan", 2.0),
+])
+def test_cache_ttl_from_env(monkeypatch, value, expected):
+    if value is None:
+        monkeypatch.delenv("PICOTOOL_CACHE_TTL", raising=False)
+    else:
+        monkeypatch.setenv("PICOTOOL_CACHE_TTL", value)
+    
+    wrapper = PicotoolWrapper("/unused/picotool", pool_size=0)
+    
+    assert wrapper._cache_ttl == expected
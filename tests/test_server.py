@@ -0,0 +1,63 @@
+"""Tests for the MCP tool handlers."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("mcp")
+
+from picotool_mcp_server import server
+
+
+class FakePicotool:
+    """Stand-in wrapper whose info() calls block until released."""
+
+    def __init__(self):
+        self.calls = []
+        self.release = asyncio.Event()
+
+    async def info(self, **options):
+        self.calls.append(options)
+        await self.release.wait()
+        return f"output {len(self.calls)}"
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    fake = FakePicotool()
+    monkeypatch.setattr(server, "_picotool", fake)
+    return fake
+
+
+def test_identical_info_calls_share_one_run(fake):
+    async def scenario():
+        first = asyncio.ensure_future(server._handle_info({}))
+        second = asyncio.ensure_future(server._handle_info({"basic": True}))
+        other = asyncio.ensure_future(server._handle_info({"pins": True}))
+        await asyncio.sleep(0)
+        fake.release.set()
+        return await asyncio.gather(first, second, other)
+
+    first, second, other = asyncio.run(scenario())
+
+    assert len(fake.calls) == 2
+    assert first == second
+    assert other != first
+    assert not server._pending
+
+
+def test_cancelled_waiter_does_not_cancel_shared_run(fake):
+    async def scenario():
+        first = asyncio.ensure_future(server._handle_info({}))
+        second = asyncio.ensure_future(server._handle_info({}))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        fake.release.set()
+        return first, await second
+
+    first, second = asyncio.run(scenario())
+
+    assert first.cancelled()
+    assert second == "output 1"
+    assert len(fake.calls) == 1